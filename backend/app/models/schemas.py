@@ -68,6 +68,17 @@ class CustomList(CustomListBase):
     created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
+class ExpandedList(CustomList):
+    """Lista dentro de una respuesta expandida (`expand=movies`)."""
+    movie_count: int
+
+
+class ExpandedListsResponse(BaseModel):
+    """Listas con sus películas, cada una incluida una sola vez."""
+    lists: list[ExpandedList]
+    movies: dict[str, dict]
+
+
 # ---------------------------------------------------------------------------
 # Modelos auxiliares para búsqueda IMDB
 # ---------------------------------------------------------------------------
@@ -2,17 +2,92 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
-
-from app.models.schemas import CustomList, CustomListCreate, CustomListUpdate, Movie
+import json
+from typing import Optional, Union
+
+from fastapi import APIRouter, HTTPException, Query, Response
+
+from app.models.schemas import (
+    CustomList,
+    CustomListCreate,
+    CustomListUpdate,
+    ExpandedList,
+    ExpandedListsResponse,
+    Movie,
+)
 from app.services.storage import store
 
 router = APIRouter(prefix="/api/lists", tags=["lists"])
 
 
-@router.get("/", response_model=list[CustomList])
-def list_custom_lists():
-    return store.get_all_lists()
+# Orden canónico de campos: la misma selección comparte entrada de caché
+MOVIE_FIELDS = tuple(Movie.model_fields)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Valida la lista de campos de `fields` (separados por comas)."""
+    if not fields:
+        return None
+    selected = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = sorted(selected.difference(MOVIE_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos de película no válidos: {', '.join(unknown)}",
+        )
+    selected.add("id")
+    return tuple(f for f in MOVIE_FIELDS if f in selected)
+
+
+@router.get("/", response_model=Union[list[CustomList], ExpandedListsResponse])
+def list_custom_lists(
+    expand: Optional[str] = Query(None, pattern="^movies$"),
+    fields: Optional[str] = None,
+    movies_limit: Optional[int] = Query(None, ge=0),
+):
+    """Devuelve todas las listas.
+
+    Con `expand=movies` incluye también las películas de cada lista en
+    una sola respuesta (`ExpandedListsResponse`): cada lista referencia sus
+    películas por id en `movie_ids` (recortado a `movies_limit` si se
+    indica, con el total en `movie_count`) y las películas aparecen una
+    única vez en `movies`, indexadas por id y limitadas a los campos de
+    `fields`. Sin `expand`, `fields` y `movies_limit` no se admiten.
+    """
+    if expand is None:
+        if fields is not None or movies_limit is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="`fields` y `movies_limit` requieren expand=movies",
+            )
+        return store.get_all_lists()
+
+    selected = _parse_fields(fields)
+    lists = []
+    movies: dict[str, str] = {}
+    for cl in store.get_all_lists():
+        # Una sola consulta por película: si se borra entre medias, se omite
+        encoded = []
+        for mid in cl.movie_ids:
+            enc = store.get_movie_json(mid, selected)
+            if enc is not None:
+                encoded.append((mid, enc))
+        shown = encoded[:movies_limit]
+        for mid, enc in shown:
+            movies.setdefault(mid, enc)
+        expanded = ExpandedList(
+            **cl.model_dump(exclude={"movie_ids"}),
+            movie_ids=[mid for mid, _ in shown],
+            movie_count=len(encoded),
+        )
+        lists.append(expanded.model_dump_json())
+    # Se empalma el JSON ya codificado de cada película en lugar de
+    # volver a serializarlas (y validarlas) con response_model
+    body = '{"lists":[%s],"movies":{%s}}' % (
+        ",".join(lists),
+        ",".join(f"{json.dumps(mid)}:{enc}" for mid, enc in movies.items()),
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{list_id}", response_model=CustomList)
@@ -31,6 +31,11 @@ class DataStore:
     def __init__(self) -> None:
         self.movies: dict[str, Movie] = {}
         self.lists: dict[str, CustomList] = {}
+        # Caché de películas codificadas en JSON: id -> (Movie, campos -> texto).
+        # Se guarda la instancia para descartar entradas de versiones antiguas.
+        self._movie_encodings: dict[
+            str, tuple[Movie, dict[Optional[tuple[str, ...]], str]]
+        ] = {}
         self._ensure_data_dir()
         self._load()
 
@@ -89,6 +94,35 @@ class DataStore:
     def get_movie(self, movie_id: str) -> Optional[Movie]:
         return self.movies.get(movie_id)
 
+    def get_movie_json(
+        self, movie_id: str, fields: Optional[tuple[str, ...]] = None
+    ) -> Optional[str]:
+        """Devuelve la película codificada en JSON, reutilizando la caché.
+
+        `fields` limita los campos incluidos (todos si es None); cada
+        combinación de campos se cachea por separado. La caché queda ligada
+        a la instancia de `Movie` con la que se generó, de modo que una
+        actualización concurrente nunca deja servida una versión antigua.
+        """
+        movie = self.movies.get(movie_id)
+        if not movie:
+            return None
+        entry = self._movie_encodings.get(movie_id)
+        if entry is None or entry[0] is not movie:
+            entry = (movie, {})
+            self._movie_encodings[movie_id] = entry
+        cached = entry[1]
+        encoded = cached.get(fields)
+        if encoded is None:
+            data = movie.model_dump(
+                mode="json", include=set(fields) if fields else None
+            )
+            if fields:
+                data = {f: data[f] for f in fields}
+            encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            cached[fields] = encoded
+        return encoded
+
     def create_movie(self, data: MovieCreate) -> Movie:
         movie = Movie(**data.model_dump())
         self.movies[movie.id] = movie
@@ -116,6 +150,7 @@ class DataStore:
         if movie_id not in self.movies:
             return False
         del self.movies[movie_id]
+        self._movie_encodings.pop(movie_id, None)
         # Limpiar de todas las listas
         for cl in self.lists.values():
             if movie_id in cl.movie_ids:
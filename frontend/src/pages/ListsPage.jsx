@@ -1,18 +1,20 @@
 import { useState, useEffect, useCallback } from "react";
 import {
-  getLists,
+  getListsWithMovies,
   createList,
   updateList,
   deleteList,
-  getMoviesInList,
   removeMovieFromList,
 } from "../services/api";
 import ListForm from "../components/ListForm";
 
+// Campos de película que necesitan las tarjetas de esta página
+const MOVIE_FIELDS = "id,title,poster,year,genre,imdb_rating";
+
 export default function ListsPage() {
   const [lists, setLists] = useState([]);
-  const [selected, setSelected] = useState(null);
-  const [listMovies, setListMovies] = useState([]);
+  const [movies, setMovies] = useState({});
+  const [selectedId, setSelectedId] = useState(null);
   const [loading, setLoading] = useState(true);
   const [showForm, setShowForm] = useState(false);
   const [editing, setEditing] = useState(null);
@@ -20,8 +22,9 @@ export default function ListsPage() {
   const loadLists = useCallback(async () => {
     setLoading(true);
     try {
-      const data = await getLists();
-      setLists(data);
+      const data = await getListsWithMovies(MOVIE_FIELDS);
+      setLists(data.lists);
+      setMovies(data.movies);
     } catch (err) {
       console.error(err);
     } finally {
@@ -33,14 +36,13 @@ export default function ListsPage() {
     loadLists();
   }, [loadLists]);
 
-  const selectList = async (list) => {
-    setSelected(list);
-    try {
-      const movies = await getMoviesInList(list.id);
-      setListMovies(movies);
-    } catch {
-      setListMovies([]);
-    }
+  const selected = lists.find((l) => l.id === selectedId) || null;
+  const listMovies = selected
+    ? selected.movie_ids.map((id) => movies[id]).filter(Boolean)
+    : [];
+
+  const selectList = (list) => {
+    setSelectedId(list.id);
   };
 
   const handleSave = async (data) => {
@@ -62,9 +64,8 @@ export default function ListsPage() {
     if (!confirm("¿Eliminar esta lista?")) return;
     try {
       await deleteList(id);
-      if (selected?.id === id) {
-        setSelected(null);
-        setListMovies([]);
+      if (selectedId === id) {
+        setSelectedId(null);
       }
       loadLists();
     } catch (err) {
@@ -76,7 +77,6 @@ export default function ListsPage() {
     if (!selected) return;
     try {
       await removeMovieFromList(selected.id, movieId);
-      selectList(selected);
       loadLists();
     } catch (err) {
       alert(err.message);
@@ -143,7 +143,7 @@ export default function ListsPage() {
                 </div>
                 <p>{l.description || "Sin descripción"}</p>
                 <p style={{ fontSize: "0.78rem", marginTop: "0.2rem" }}>
-                  {l.movie_ids.length} película(s)
+                  {l.movie_count} película(s)
                 </p>
               </div>
             ))}
@@ -34,6 +34,10 @@ export const deleteMovie = (id) =>
 // ======================== Lists ========================
 
 export const getLists = () => request("/lists/");
+export const getListsWithMovies = (fields) =>
+  request(
+    `/lists/?expand=movies${fields ? `&fields=${encodeURIComponent(fields)}` : ""}`
+  );
 export const getList = (id) => request(`/lists/${id}`);
 export const createList = (data) =>
   request("/lists/", { method: "POST", body: JSON.stringify(data) });